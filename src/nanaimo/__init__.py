@@ -29,7 +29,7 @@ import typing
 from .config import ArgumentDefaults
 
 
-class AssertionError(RuntimeError):
+class FixtureAssertionError(RuntimeError):
     """
     Thrown by Nanaimo tests when an assertion has failed.
 
@@ -41,6 +41,13 @@ class AssertionError(RuntimeError):
     pass
 
 
+AssertionError = FixtureAssertionError
+"""
+DEPRECATED. Alias of :class:`FixtureAssertionError` retained for existing users of ``nanaimo.AssertionError``.
+Use :class:`FixtureAssertionError` which does not shadow the builtin :class:`AssertionError`.
+"""
+
+
 class Arguments:
     """
     Adapter for pytest and argparse parser arguments.
@@ -357,29 +364,22 @@ class Namespace:
                  allow_none_values: bool = True):
         self._defaults = defaults
         if parent is not None:
-            for key in vars(parent):
-                parent_value = getattr(parent, key)
+            for key, parent_value in vars(parent).items():
                 if allow_none_values or parent_value is not None:
                     setattr(self, key, parent_value)
 
     def __getattr__(self, key: str) -> typing.Any:
+        # Python only calls __getattr__ after the instance __dict__ has missed so we go straight to the defaults.
+        defaults = self.__dict__.get('_defaults')
+        if defaults is None:
+            return None
         try:
-            return self.__dict__[key]
-        except KeyError:
-            if self._defaults is None:
-                return None
-        try:
-            return self._defaults[key]
+            return defaults[key]
         except KeyError:
             return None
 
-    def __contains__(self, key: str) -> typing.Any:
-        if key in self.__dict__:
-            return True
-        elif self._defaults is None:
-            return False
-        else:
-            return key in self._defaults
+    def __contains__(self, key: str) -> bool:
+        return key in self.__dict__ or (self._defaults is not None and key in self._defaults)
 
     def get_as_merged_dict(self, key: str) -> typing.Mapping[str, typing.Any]:
         """
@@ -526,20 +526,12 @@ class Artifacts(Namespace):
                  defaults: typing.Optional[ArgumentDefaults] = None,
                  allow_none_values: bool = True):
         super().__init__(parent=parent, defaults=defaults, allow_none_values=allow_none_values)
-        self._result_code = result_code
-
-    @property
-    def result_code(self) -> int:
+        self.result_code = result_code
         """
         0 if the artifacts were retrieved without error. Non-zero if some error
         occurred. The contents of this :class:`Namespace` is undefined for non-zero
         result codes.
         """
-        return self._result_code
-
-    @result_code.setter
-    def result_code(self, new_result: int) -> None:
-        self._result_code = new_result
 
     def dump(self, logger: logging.Logger, log_level: int = logging.DEBUG) -> None:
         """
@@ -560,7 +552,7 @@ class Artifacts(Namespace):
         """
         Converts a reference to this object into its `result_code`.
         """
-        return self._result_code
+        return self.result_code
 
 
 def assert_success(artifacts: Artifacts) -> Artifacts:
@@ -654,7 +646,7 @@ def assert_success_if(artifacts: Artifacts, conditional: typing.Callable[[Artifa
 
             assert_success_if(await fixture.gather(), lambda _: False)
 
-        with pytest.raises(nanaimo.AssertionError):
+        with pytest.raises(AssertionError):
             _doc_loop.run_until_complete(test_failure())
 
     :param artifacts: The artifacts to assert on.
@@ -117,6 +117,7 @@ class ArgumentDefaults:
         self._configparser = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
         self._logger = logging.getLogger(__name__)
         self._value_types = dict()  # type: typing.Dict[str, typing.Type]
+        self._resolved = dict()  # type: typing.Dict[str, typing.Any]
         if args is not None:
             self.set_args(args)
         else:
@@ -131,11 +132,39 @@ class ArgumentDefaults:
         for read_location in read_locations:
             resolved_locations.append(str(pathlib.Path(read_location).expanduser()))
         read_from = self._configparser.read(resolved_locations)
+        self._resolved.clear()
         self._logger.debug('Configuration read from {}'.format(str(read_from)))
 
     def __getitem__(self, key: str) -> typing.Any:
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            try:
+                resolved = self._resolve(key)
+            except KeyError:
+                resolved = self._not_found
+            self._resolved[key] = resolved
+        if resolved is self._not_found:
+            raise KeyError(key)
+        return resolved
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            _ = self[key]
+            return True
+        except KeyError:
+            return False
+
+    _not_found = object()
+    """
+    Sentinel cached in place of a value for keys that were not found in the configuration.
+    """
+
+    def _resolve(self, key: str) -> typing.Any:
+        """
+        Search the configuration space for a key. This is the uncached path for :meth:`__getitem__`.
+        """
         namespaced_key = key.split('_')
-        type_cast = typing.cast(typing.Type, (str if key not in self._value_types else self._value_types[key]))
+        type_cast = self._value_types.get(key, str)  # type: typing.Type
         # Try once with nanaimo prefix (more specific)
         for x in range(len(namespaced_key) - 1, 0, -1):
             try:
@@ -156,13 +185,6 @@ class ArgumentDefaults:
 
         return type_cast(self._configparser['nanaimo'][key])
 
-    def __contains__(self, key: str) -> bool:
-        try:
-            _ = self[key]
-            return True
-        except KeyError:
-            return False
-
     def populate_default(self,
                          parser: argparse.ArgumentParser,
                          inout_args: typing.Tuple,
@@ -176,6 +198,7 @@ class ArgumentDefaults:
                 if 'type' in inout_kwargs:
                     type_cast = inout_kwargs['type']
                     self._value_types[derived_key] = type_cast
+                    self._resolved.pop(derived_key, None)
                     inout_kwargs['default'] = type_cast(from_config)
                 else:
                     inout_kwargs['default'] = from_config
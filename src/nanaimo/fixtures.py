@@ -28,6 +28,7 @@ import io
 import logging
 import math
 import textwrap
+import time
 import typing
 
 import nanaimo
@@ -77,6 +78,13 @@ class Fixture(metaclass=abc.ABCMeta):
 
         pytest --foo=baz
 
+    .. note::
+        :class:`Fixture` and :class:`SubprocessFixture` declare ``__slots__``. A fixture may still derive from several
+        fixture types so long as only one branch of its bases adds slots. For example, deriving from
+        ``nanaimo_bar.Fixture`` and ``nanaimo_cmd.Fixture`` is fine since only the latter adds slots (through
+        :class:`SubprocessFixture`). Combining two branches that each declare non-empty ``__slots__`` will fail with
+        ``TypeError: multiple bases have instance lay-out conflict``.
+
     :param FixtureManager manager: The fixture manager that is the scope for this fixture. There must be
         a 1:1 relationship between a fixture instance and a fixture manager instance.
     :param nanaimo.Namespace args: A namespace containing the arguments for this fixture.
@@ -85,6 +93,16 @@ class Fixture(metaclass=abc.ABCMeta):
         arguments may used by fixture specializations.
     """
 
+    __slots__ = ('_manager', '_args', '_name', '_logger', '_gather_timeout_seconds')
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        setattr(cls, '_canonical_name_cache', cls._make_canonical_name())
+
+    @classmethod
+    def _make_canonical_name(cls) -> str:
+        return str(getattr(cls, 'fixture_name', '.'.join([cls.__module__, cls.__qualname__])))
+
     @classmethod
     def get_canonical_name(cls) -> str:
         """
@@ -105,8 +123,28 @@ class Fixture(metaclass=abc.ABCMeta):
 
             assert 'my_fixture' == MyFixture.get_canonical_name()
 
+        The name is computed once, when the class is defined, so changing ``fixture_name`` on a class after
+        its definition has no effect.
         """
-        return str(getattr(cls, 'fixture_name', '.'.join([cls.__module__, cls.__qualname__])))
+        # Look in the class' own __dict__ so subclasses don't inherit their parent's cached name. The lazy path
+        # covers the Fixture base class itself and Python versions without __init_subclass__.
+        canonical_name = cls.__dict__.get('_canonical_name_cache')  # type: typing.Optional[str]
+        if canonical_name is None:
+            canonical_name = cls._make_canonical_name()
+            setattr(cls, '_canonical_name_cache', canonical_name)
+        return canonical_name
+
+    @classmethod
+    def _get_class_logger(cls) -> logging.Logger:
+        """
+        Fixture loggers are named for the fixture's canonical name so every instance of a given type uses the same
+        logger. We cache this on the class to avoid taking the logging module's lock for every new instance.
+        """
+        logger = cls.__dict__.get('_logger_cache')  # type: typing.Optional[logging.Logger]
+        if logger is None:
+            logger = logging.getLogger(cls.get_canonical_name())
+            setattr(cls, '_logger_cache', logger)
+        return logger
 
     @classmethod
     def get_argument_prefix(cls) -> str:
@@ -186,13 +224,12 @@ class Fixture(metaclass=abc.ABCMeta):
         self._manager = manager
         self._args = (args if args is not None else nanaimo.Namespace())
         self._name = self.get_canonical_name()
-        self._logger = logging.getLogger(self._name)
+        self._logger = self._get_class_logger()
         if 'loop' in kwargs:
             raise ValueError('Do not pass the loop into the fixture. '
                              'Fixtures obtain the loop from their FixtureManager.')
         if 'gather_timeout_seconds' in kwargs:
-            gather_timeout_seconds = typing.cast(typing.Optional[float], kwargs['gather_timeout_seconds'])
-            self._gather_timeout_seconds = gather_timeout_seconds
+            self._gather_timeout_seconds = kwargs['gather_timeout_seconds']  # type: typing.Optional[float]
         else:
             self._gather_timeout_seconds = None
 
@@ -278,9 +315,10 @@ class Fixture(metaclass=abc.ABCMeta):
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         """
-        The running asyncio EventLoop in use by this Fixture.
-        This will be the loop provided to the fixture in the constructor if that loop is still
-        running otherwise the loop will be a running loop retrieved by :func:`asyncio.get_event_loop`.
+        The running asyncio EventLoop in use by this Fixture. This is the loop of the fixture's
+        :class:`FixtureManager`: the loop provided to the manager in its constructor if that loop has not been
+        closed otherwise the loop retrieved by :func:`asyncio.get_event_loop`. When called from a coroutine that is
+        the running loop.
         :raises RuntimeError: if no running event loop could be found.
         """
         return self.manager.loop
@@ -375,22 +413,38 @@ class Fixture(metaclass=abc.ABCMeta):
     # | ASYNC HELPERS
     # +-----------------------------------------------------------------------+
 
-    async def countdown_sleep(self, sleep_time_seconds: float) -> None:
+    async def countdown_sleep(self, sleep_time_seconds: float, log_interval: float = 1.0) -> None:
         """
-        Calls :func:`asyncio.sleep` for 1 second then emits an :meth:`logging.Logger.info`
+        Calls :func:`asyncio.sleep` for `log_interval` seconds then emits an :meth:`logging.Logger.info`
         of the time remaining until `sleep_time_seconds`.
         This is useful for long waits as an indication that the process is not deadlocked.
 
         :param sleep_time_seconds:  The amount of time in seconds for this coroutine to wait
-            before exiting. For each second that passes while waiting for this amount of time
-            the coroutine will :func:`asyncio.sleep` for 1 second.
+            before exiting. For each `log_interval` that passes while waiting for this amount of time
+            the coroutine will log the number of seconds remaining.
         :type sleep_time_seconds: float
-        """
-        count_down = sleep_time_seconds
-        while count_down >= 0:
-            self._logger.info('%d', math.ceil(count_down))
-            await asyncio.sleep(1)
-            count_down -= 1
+        :param log_interval: The amount of time in seconds to sleep between each log of the time remaining.
+        :type log_interval: float
+        :raises ValueError: if `log_interval` is not greater than zero.
+        """
+        if log_interval <= 0:
+            raise ValueError('log_interval must be greater than zero (got {})'.format(log_interval))
+        clock = self.loop.time
+        logger = self._logger
+        logger_info = logger.info
+        ceil = math.ceil
+        # asyncio runs timers that are within the clock's resolution of their deadline so a sleep can return a hair
+        # early. Treat anything left below the resolution as done rather than logging again and sleeping for ~0.
+        resolution = time.get_clock_info('monotonic').resolution
+        deadline = clock() + sleep_time_seconds
+        while True:
+            remaining = deadline - clock()
+            if remaining <= resolution:
+                break
+            # The level is checked on each pass since it may be changed while we sleep.
+            if logger.isEnabledFor(logging.INFO):
+                logger_info('%d', ceil(remaining))
+            await asyncio.sleep(min(log_interval, remaining))
 
     async def observe_tasks_assert_not_done(self,
                                             observer_co_or_f: typing.Union[typing.Coroutine, asyncio.Future],
@@ -405,18 +459,20 @@ class Fixture(metaclass=abc.ABCMeta):
         :type observer_co_or_f: typing.Union[typing.Coroutine, asyncio.Future]
         :param float timeout_seconds: Time in seconds to observe for before raising :class:`asyncio.TimeoutError`.
             Set to None to disable.
-        :param persistent_tasks: Iterable of tasks that must remain active or :class:`AssertionError` will be raised.
+        :param persistent_tasks: Iterable of tasks that must remain active or
+            :class:`nanaimo.FixtureAssertionError` will be raised.
         :type persistent_tasks: typing.Union[typing.Coroutine, asyncio.Future]
 
         :return: a list of the persistent tasks as futures.
         :rtype: typing.Set[asyncio.Future]
 
-        :raises AssertionError: if any of the persistent tasks exited.
+        :raises nanaimo.FixtureAssertionError: if any of the persistent tasks exited.
         :raises asyncio.TimeoutError: if the observer task does not complete within ``timeout_seconds``.
         """
         _, _, done, pending = await self._observe_tasks(observer_co_or_f, timeout_seconds, False, *persistent_tasks)
         if len(done) > 1:
-            raise nanaimo.AssertionError('Tasks under observation completed before the observation was complete.')
+            raise nanaimo.FixtureAssertionError('Tasks under observation completed before the observation was '
+                                                'complete.')
         return pending
 
     async def observe_tasks(self,
@@ -439,7 +495,6 @@ class Fixture(metaclass=abc.ABCMeta):
         :return: a list of the persistent tasks as futures.
         :rtype: typing.Set[asyncio.Future]
 
-        :raises AssertionError: if any of the persistent tasks exited.
         :raises asyncio.TimeoutError: if the observer task does not complete within ``timeout_seconds``.
         """
 
@@ -498,7 +553,6 @@ class Fixture(metaclass=abc.ABCMeta):
         :return: a tuple of the gate future and a set of the gated futures.
         :rtype: typing.Tuple[asyncio.Future, typing.Set[asyncio.Future]]:
 
-        :raises AssertionError: if any of the persistent tasks exited.
         :raises asyncio.TimeoutError: if the observer task does not complete within ``timeout_seconds``.
         """
 
@@ -527,34 +581,21 @@ class Fixture(metaclass=abc.ABCMeta):
         """
         :returns: observer, observed, done, pending
         """
-        did_timeout = False
-        observer_future = asyncio.ensure_future(observer_co_or_f)
-        the_children_are_our_futures = [observer_future]
-        observed_futures = []
-        done_done = set()  # type: typing.Set[asyncio.Future]
-        for co_or_f in args:
-            o = asyncio.ensure_future(co_or_f)
-            the_children_are_our_futures.append(o)
-            observed_futures.append(o)
+        observer_future = _ensure_future_eagerly(observer_co_or_f)
+        observed_futures = [_ensure_future_eagerly(co_or_f) for co_or_f in args]
 
-        start_time = self.loop.time()
-
-        while True:
-            done, pending = await asyncio.wait(
-                the_children_are_our_futures,
-                timeout=timeout_seconds,
-                return_when=asyncio.FIRST_COMPLETED)  # type: typing.Set[asyncio.Future], typing.Set[asyncio.Future]
+        # Only the observer's completion ends the observation so it's the only future we wait on. The observed
+        # futures run in the background and are sorted into done or pending afterwards.
+        await asyncio.wait((observer_future,), timeout=timeout_seconds)
+        did_timeout = not observer_future.done()
 
-            for d in done:
-                the_children_are_our_futures.remove(d)
-                done_done.add(d)
-
-            if observer_future.done():
-                break
-
-            if timeout_seconds is not None and self.loop.time() - start_time > timeout_seconds:
-                did_timeout = True
-                break
+        done_done = set()  # type: typing.Set[asyncio.Future]
+        pending = set()  # type: typing.Set[asyncio.Future]
+        for f in (observer_future, *observed_futures):
+            if f.done():
+                done_done.add(f)
+            else:
+                pending.add(f)
 
         if cancel_remaining:
             await self._do_cancel_remaining(pending)
@@ -567,6 +608,32 @@ class Fixture(metaclass=abc.ABCMeta):
             return observer_future, observed_futures, done_done, pending
 
 
+_eager_start_supported = hasattr(asyncio, 'eager_task_factory')
+
+
+def _ensure_future_eagerly(co_or_f: typing.Union[typing.Coroutine, asyncio.Future]) -> asyncio.Future:
+    """
+    Like :func:`asyncio.ensure_future` but, where the running Python supports it (3.12 and newer), coroutines are
+    started eagerly on the running loop. An eager task runs synchronously until its first suspension so coroutines
+    that complete without ever blocking skip the round trip through the event loop's scheduler. This is applied to
+    individual tasks rather than by installing :func:`asyncio.eager_task_factory` since the loop is not owned by
+    Nanaimo.
+
+    .. note::
+
+        Creating an eager task bypasses the loop's task factory so, if a task factory has been installed on the
+        running loop, coroutines are not started eagerly and are instead scheduled by
+        :func:`asyncio.ensure_future` which uses that factory.
+
+    Must be called from a coroutine running on the loop the tasks are to run on.
+    """
+    if _eager_start_supported and asyncio.iscoroutine(co_or_f):
+        loop = asyncio.get_running_loop()
+        if loop.get_task_factory() is None:
+            return asyncio.Task(co_or_f, loop=loop, eager_start=True)  # type: ignore
+    return asyncio.ensure_future(co_or_f)
+
+
 # +---------------------------------------------------------------------------+
 
 
@@ -628,6 +695,8 @@ class SubprocessFixture(Fixture):
     :param stderr_filter: A :class:`logging.Filter` used when gathering the subprocess.
     """
 
+    __slots__ = ('_stdout_filter', '_stderr_filter')
+
     class SubprocessMessageAccumulator(logging.Filter, io.StringIO):
         """
         Helper class for working with :meth:`SubprocessFixture.stdout_filter` or
@@ -902,8 +971,9 @@ class FixtureManager:
     def loop(self) -> asyncio.AbstractEventLoop:
         """
         The running asyncio EventLoop in use by all Fixtures.
-        This will be the loop provided to the fixture manager in the constructor if that loop is still
-        running otherwise the loop will be a running loop retrieved by :func:`asyncio.get_event_loop`.
+        This will be the loop provided to the fixture manager in the constructor if that loop has not been closed
+        otherwise the loop will be the one retrieved by :func:`asyncio.get_event_loop`. When called from a
+        coroutine that is the running loop.
         :raises RuntimeError: if no running event loop could be found.
         """
         if self._loop is None or self._loop.is_closed():
@@ -37,11 +37,12 @@ class Parser:
         self._completion_pattern = re.compile(r'\[\s*(PASSED|FAILED)\s*\]\s*(\d+)\s+tests?\.')
 
     async def read_test(self, uart: nanaimo.connections.AbstractAsyncSerial) -> int:
-        start_time = self._loop.time()
+        clock = self._loop.time
+        start_time = clock()
         result = 1
         line_count = 0
         while True:
-            now = self._loop.time()
+            now = clock()
             if now - start_time > self._timeout_seconds:
                 result = 2
                 break
@@ -57,9 +58,9 @@ class Parser:
                 result = (0 if line_match.group(1) == 'PASSED' else 1)
                 break
         if 0 == result:
-            self._logger.info('Detected successful test after %f seconds.', self._loop.time() - start_time)
+            self._logger.info('Detected successful test after %f seconds.', clock() - start_time)
         elif 2 == result:
-            self._logger.warning('gtest.Parser timeout after %f seconds', self._loop.time() - start_time)
+            self._logger.warning('gtest.Parser timeout after %f seconds', clock() - start_time)
         self._logger.debug('Processed %d lines. There were %d buffer full events reported.',
                            line_count,
                            uart.rx_buffer_overflows)
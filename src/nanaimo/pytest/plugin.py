@@ -348,8 +348,9 @@ class PytestFixtureManager(nanaimo.fixtures.FixtureManager):
                        args: typing.Optional[nanaimo.Namespace] = None,
                        loop: typing.Optional[asyncio.AbstractEventLoop] = None) -> nanaimo.fixtures.Fixture:
         fixture_plugin = self._pluginmanager.get_plugin(canonical_name)
-        fixture_type = fixture_plugin.fixture_type
-        return fixture_type(self, args)
+        if not isinstance(fixture_plugin, _SyntheticPlugin):
+            raise KeyError('{} is not a registered nanaimo fixture.'.format(canonical_name))
+        return fixture_plugin.fixture_type(self, args)
 
 
 # +---------------------------------------------------------------------------+
@@ -362,11 +363,11 @@ _display_singleton = None  # type: typing.Optional[nanaimo.display.CharacterDisp
 def _get_display(config: _pytest.config.Config) -> 'nanaimo.display.CharacterDisplay':
     global _display_singleton
     if _display_singleton is None:
-        for fixture_type in config.pluginmanager.hook.pytest_nanaimo_fixture_type():
-            if fixture_type.get_canonical_name() == 'character_display':
-                _display_singleton = fixture_type(nanaimo.fixtures.FixtureManager(asyncio.get_event_loop()))
-        if _display_singleton is None:
+        display_plugin = config.pluginmanager.get_plugin('character_display')
+        if not isinstance(display_plugin, _SyntheticPlugin):
             raise KeyError('character_display fixture was not found.')
+        display_type = display_plugin.fixture_type  # type: typing.Any
+        _display_singleton = display_type(nanaimo.fixtures.FixtureManager(asyncio.get_event_loop()))
     return _display_singleton
 
 
@@ -610,7 +611,7 @@ def pytest_runtest_teardown(item: pytest.Item, nextitem: pytest.Item) -> None:
         args = item.funcargs
         for name, value in args.items():
             if isinstance(value, nanaimo.fixtures.Fixture):
-                typing.cast(nanaimo.fixtures.Fixture, value).on_test_teardown(item.name)
+                value.on_test_teardown(item.name)
 
 
 def pytest_sessionfinish(session: _pytest.main.Session, exitstatus: int) -> None:
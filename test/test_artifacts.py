@@ -32,3 +32,15 @@ def test_result_code() -> None:
     assert 1 == int(subject_1)
     subject_1.result_code = 2
     assert 2 == int(subject_1)
+
+
+def test_combine_result_code() -> None:
+    """
+    Verifies that combining artifacts sets a new result code without modifying the originals.
+    """
+    first = nanaimo.Artifacts(0)
+    second = nanaimo.Artifacts(1)
+    combined = nanaimo.Artifacts.combine(first, second)
+    assert -1 == combined.result_code
+    assert 0 == first.result_code
+    assert 0 == nanaimo.Artifacts.combine(first, nanaimo.Artifacts(0)).result_code
@@ -5,6 +5,7 @@
 
 import configparser
 import pathlib
+import unittest.mock
 
 import nanaimo
 from nanaimo.config import ArgumentDefaults
@@ -120,3 +121,22 @@ def test_setup_cfg_with_none_value(local_setup_cfg: pathlib.Path) -> None:
     assert subject0.test_cfg is None
     subject1 = nanaimo.Namespace(fake_args, defaults, allow_none_values=False)
     assert subject1.test_cfg == '2'
+
+
+def test_defaults_lookup_is_cached(test_config: pathlib.Path) -> None:
+    """
+    Verify that defaults are only searched for once per key until the configuration is reloaded.
+    """
+    fake_args = nanaimo.Namespace()
+    setattr(fake_args, 'rcfile', str(test_config))
+    defaults = ArgumentDefaults()
+    subject = nanaimo.Namespace(None, defaults)
+    with unittest.mock.patch.object(defaults, '_resolve', wraps=defaults._resolve) as resolve:
+        assert 'test_attr_yup' not in subject
+        assert subject.test_attr_yup is None
+        assert 1 == resolve.call_count
+
+        defaults.set_args(fake_args)
+        assert subject.test_attr_yup == 'yup'
+        assert 'test_attr_yup' in subject
+        assert 2 == resolve.call_count
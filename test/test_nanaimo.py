@@ -106,3 +106,13 @@ def test_get_as_merged_dict() -> None:
     defaults.__getitem__ = MagicMock(side_effect=KeyError())
 
     nanaimo.Namespace(defaults=defaults).get_as_merged_dict('environ')
+
+
+def test_assertion_error_alias() -> None:
+    """
+    Verify the deprecated nanaimo.AssertionError name still refers to FixtureAssertionError.
+    """
+    assert nanaimo.AssertionError is nanaimo.FixtureAssertionError
+    assert nanaimo.FixtureAssertionError is not AssertionError
+    with pytest.raises(nanaimo.AssertionError):
+        raise nanaimo.FixtureAssertionError()
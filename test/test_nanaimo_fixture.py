@@ -4,7 +4,10 @@
 #
 import argparse
 import asyncio
+import logging
 import pathlib
+import sys
+import time
 import typing
 
 import pytest
@@ -21,12 +24,21 @@ class CanonicallyNamed(nanaimo.fixtures.Fixture):
     fixture_name = 'foo_bar'
 
 
+class CanonicallyNamedSubclass(CanonicallyNamed):
+
+    fixture_name = 'foo_bar_baz'
+
+
 def test_canonical_name(dummy_nanaimo_fixture: nanaimo.fixtures.Fixture) -> None:
     """
     Verify the behavior of Fixture.get_canonical_name()
     """
     assert 'material.DummyFixture' == type(dummy_nanaimo_fixture).get_canonical_name()
     assert CanonicallyNamed.fixture_name == CanonicallyNamed.get_canonical_name()
+    assert CanonicallyNamedSubclass.fixture_name == CanonicallyNamedSubclass.get_canonical_name()
+    # Each class caches its own name in its own __dict__ so a subclass never sees its parent's cached value.
+    assert 'foo_bar' == CanonicallyNamed.__dict__['_canonical_name_cache']
+    assert 'foo_bar_baz' == CanonicallyNamedSubclass.__dict__['_canonical_name_cache']
 
 
 @pytest.mark.asyncio
@@ -89,7 +101,7 @@ async def test_observe_tasks_failure(dummy_nanaimo_fixture: nanaimo.fixtures.Fix
     async def running() -> int:
         return 1
 
-    with pytest.raises(nanaimo.AssertionError):
+    with pytest.raises(nanaimo.FixtureAssertionError):
         await dummy_nanaimo_fixture.observe_tasks_assert_not_done(evaluating(),
                                                                   None,
                                                                   running())
@@ -141,6 +153,72 @@ async def test_observe_tasks_timeout(dummy_nanaimo_fixture: nanaimo.fixtures.Fix
                                                                   running())
 
 
+@pytest.mark.timeout(10)
+@pytest.mark.asyncio
+async def test_observe_tasks_manager_loop_not_running() -> None:
+    """
+    The observed tasks must run on the loop awaiting them even if the fixture manager holds some other loop.
+    """
+    other_loop = asyncio.new_event_loop()
+    try:
+        subject = nanaimo_bar.Fixture(nanaimo.fixtures.FixtureManager(other_loop))
+
+        async def evaluating() -> int:
+            await asyncio.sleep(.1)
+            return 0
+
+        async def running() -> int:
+            await asyncio.sleep(10)
+            return 1
+
+        gate, gated = await subject.gate_tasks(evaluating(), 5, running())
+        assert 0 == gate.result()
+        assert gated[0].cancelled()
+    finally:
+        other_loop.close()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='eager tasks require Python 3.12 or newer')
+@pytest.mark.asyncio
+async def test_eager_observer() -> None:
+    """
+    On Python versions that support it, coroutines that never suspend are complete as soon as they are observed.
+    """
+    async def completes_synchronously() -> int:
+        return 0
+
+    future = nanaimo.fixtures._ensure_future_eagerly(completes_synchronously())
+    assert future.done()
+    assert 0 == future.result()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='eager tasks require Python 3.12 or newer')
+@pytest.mark.asyncio
+async def test_eager_observer_respects_task_factory() -> None:
+    """
+    Eager start is skipped when a task factory is installed on the running loop so the factory is still used.
+    """
+    loop = asyncio.get_running_loop()
+    created = []
+
+    def factory(loop: asyncio.AbstractEventLoop, coro: typing.Coroutine, **kwargs: typing.Any) -> asyncio.Future:
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        created.append(task)
+        return task
+
+    async def completes_synchronously() -> int:
+        return 0
+
+    loop.set_task_factory(factory)
+    try:
+        future = nanaimo.fixtures._ensure_future_eagerly(completes_synchronously())
+        assert not future.done()
+        assert [future] == created
+        assert 0 == await future
+    finally:
+        loop.set_task_factory(None)
+
+
 @pytest.mark.timeout(20)
 @pytest.mark.asyncio
 async def test_countdown_sleep(dummy_nanaimo_fixture: nanaimo.fixtures.Fixture) -> None:
@@ -150,6 +228,44 @@ async def test_countdown_sleep(dummy_nanaimo_fixture: nanaimo.fixtures.Fixture)
     await dummy_nanaimo_fixture.countdown_sleep(5.3)
 
 
+@pytest.mark.timeout(20)
+@pytest.mark.asyncio
+async def test_countdown_sleep_log_interval(dummy_nanaimo_fixture: nanaimo.fixtures.Fixture,
+                                            caplog: typing.Any) -> None:
+    """
+    Verify countdown_sleep waits for the requested time regardless of the log interval, logs once per interval
+    only when INFO is enabled, and rejects intervals that are not positive.
+    """
+    loop = dummy_nanaimo_fixture.loop
+    logger_name = dummy_nanaimo_fixture.logger.name
+    resolution = time.get_clock_info('monotonic').resolution
+
+    def countdown_records() -> typing.List[logging.LogRecord]:
+        return [r for r in caplog.records if r.name == logger_name and r.levelno == logging.INFO]
+
+    caplog.set_level(logging.INFO, logger=logger_name)
+    start_time = loop.time()
+    await dummy_nanaimo_fixture.countdown_sleep(1.5, log_interval=.5)
+    assert loop.time() - start_time >= 1.5 - resolution
+    assert 3 == len(countdown_records())
+    assert '2' == countdown_records()[0].getMessage()
+
+    caplog.clear()
+    start_time = loop.time()
+    await dummy_nanaimo_fixture.countdown_sleep(.5, log_interval=10)
+    assert 10 > loop.time() - start_time >= .5 - resolution
+    assert 1 == len(countdown_records())
+
+    caplog.clear()
+    caplog.set_level(logging.WARNING, logger=logger_name)
+    await dummy_nanaimo_fixture.countdown_sleep(1, log_interval=.25)
+    assert 0 == len(countdown_records())
+
+    for bad_interval in (0, -1):
+        with pytest.raises(ValueError):
+            await dummy_nanaimo_fixture.countdown_sleep(1, log_interval=bad_interval)
+
+
 @pytest.mark.timeout(20)
 @pytest.mark.asyncio
 async def test_gather_timeout(event_loop: asyncio.AbstractEventLoop) -> None:
@@ -329,3 +445,15 @@ async def test_loop_into_fixture_arg(event_loop: asyncio.AbstractEventLoop) -> N
         Dummy(nanaimo.fixtures.FixtureManager(event_loop),
               nanaimo.Namespace(),
               loop=event_loop)
+
+
+def test_fixture_logger(dummy_nanaimo_fixture: nanaimo.fixtures.Fixture) -> None:
+    """
+    Verify fixtures of the same type share a logger named for their canonical name.
+    """
+    other = type(dummy_nanaimo_fixture)(dummy_nanaimo_fixture.manager)
+    assert dummy_nanaimo_fixture.logger is other.logger
+    assert dummy_nanaimo_fixture.logger.name == dummy_nanaimo_fixture.name
+    bar = nanaimo_bar.Fixture(dummy_nanaimo_fixture.manager)
+    assert bar.logger is not dummy_nanaimo_fixture.logger
+    assert bar.logger.name == bar.name
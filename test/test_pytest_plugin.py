@@ -45,6 +45,16 @@ async def test_another_nanaimo_bar(nanaimo_fixture_manager: nanaimo.fixtures.Fix
     assert nanaimo_bar.loop.is_running()
 
 
+def test_create_unknown_fixture(nanaimo_fixture_manager: nanaimo.fixtures.FixtureManager) -> None:
+    """
+    Verify that the fixture manager raises KeyError for names that are not registered nanaimo fixtures.
+    """
+    with pytest.raises(KeyError):
+        nanaimo_fixture_manager.create_fixture('not_a_nanaimo_fixture')
+    with pytest.raises(KeyError):
+        nanaimo_fixture_manager.create_fixture('terminalreporter')
+
+
 @pytest.mark.xfail
 def test_assert_success() -> None:
     nanaimo.pytest.plugin.assert_success(nanaimo.Artifacts(1))